@@ -6,6 +6,6 @@
 路由逻辑独立文件。
 """
 
-from .routing import check_split_result, check_continue
+from .routing import check_split_result
 
-__all__ = ["check_split_result", "check_continue"]
+__all__ = ["check_split_result"]
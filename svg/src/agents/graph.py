@@ -12,10 +12,10 @@ from langgraph.checkpoint.memory import MemorySaver
 
 from .state import WorkflowState
 from .nodes import (
-    initialize, split_document, prepare_draw,
+    initialize, split_document,
     draw_svg, generate_report, handle_error,
 )
-from .edges import check_split_result, check_continue
+from .edges import check_split_result
 
 
 def build_workflow() -> StateGraph:
@@ -34,31 +34,13 @@ def build_workflow() -> StateGraph:
                     └──────┬──────┘
                            │
               ┌────────────┴────────────┐
-              │                         │
-              ▼                         ▼
+              │ check_split（条件检查）   │
+              ▼ 成功                     ▼ 失败/空
     ┌─────────────────┐      ┌─────────────────┐
-    │  check_split    │      │   handle_error  │
-    │  (条件检查)      │      │   (错误处理)     │
+    │    draw_svg     │      │   handle_error  │
+    │ (并发绘制全部章节) │      │   (错误处理)     │
     └────────┬────────┘      └─────────────────┘
-             │ 成功
-             ▼
-    ┌─────────────────┐
-    │  prepare_draw   │◄────────────────┐
-    │  (准备绘图)      │                 │
-    └────────┬────────┘                 │
-             │                          │
-             ▼                          │
-    ┌─────────────────┐                 │
-    │    draw_svg     │                 │
-    │  (智能绘图)      │                 │
-    └────────┬────────┘                 │
-             │                          │
-             ▼                          │
-    ┌─────────────────┐                 │
-    │  check_continue │─────────────────┘
-    │  (继续检查)      │（还有章节）
-    └────────┬────────┘
-             │ 完成
+             │
              ▼
     ┌─────────────────┐
     │ generate_report │
@@ -74,7 +56,6 @@ def build_workflow() -> StateGraph:
     # 添加节点
     workflow.add_node("initialize", initialize)
     workflow.add_node("split_document", split_document)
-    workflow.add_node("prepare_draw", prepare_draw)
     workflow.add_node("draw_svg", draw_svg)
     workflow.add_node("generate_report", generate_report)
     workflow.add_node("handle_error", handle_error)
@@ -90,23 +71,13 @@ def build_workflow() -> StateGraph:
         "split_document",
         check_split_result,
         {
-            "prepare_draw": "prepare_draw",
+            "draw_svg": "draw_svg",
             "handle_error": "handle_error"
         }
     )
 
-    # 准备绘图 -> 智能绘图
-    workflow.add_edge("prepare_draw", "draw_svg")
-
-    # 条件分支：继续检查（循环或完成）
-    workflow.add_conditional_edges(
-        "draw_svg",
-        check_continue,
-        {
-            "prepare_draw": "prepare_draw",
-            "generate_report": "generate_report"
-        }
-    )
+    # 智能绘图（一次并发处理全部章节）-> 生成报告
+    workflow.add_edge("draw_svg", "generate_report")
 
     # 结束节点
     workflow.add_edge("generate_report", END)
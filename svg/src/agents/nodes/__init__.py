@@ -8,7 +8,6 @@
 
 from .initialize import initialize
 from .split_document import split_document
-from .prepare_draw import prepare_draw
 from .draw_svg import draw_svg
 from .generate_report import generate_report
 from .handle_error import handle_error
@@ -16,7 +15,6 @@ from .handle_error import handle_error
 __all__ = [
     "initialize",
     "split_document",
-    "prepare_draw",
     "draw_svg",
     "generate_report",
     "handle_error",
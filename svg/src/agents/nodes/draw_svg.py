@@ -5,25 +5,166 @@ SVG 绘图节点
 
 职责：
 1. 使用 SmartDrawer 获取提示词
-2. 调用 LLM 生成 SVG
+2. 调用 LLM 生成 SVG（剩余章节在同一事件循环内并发绘制，AIMD 自适应调整在途请求数）
 3. 验证保存 SVG
 4. 记录结果
+5. 断点续跑：上次已成功的章节直接复用 SVG 文件；每成功一个章节追加一条进度记录
 """
 
-from typing import Dict, Any, List
+import asyncio
+import os
+from typing import Dict, Any, List, Optional
 
-from ...agents.state import WorkflowState, SVGResult
+from ...agents.state import WorkflowState, Section, SVGResult
 from ...config import ConfigManager
 from ...tools import SmartDrawer
-from ...utils import register_node
+from ...utils import AIMDLimiter, append_jsonl, register_node
 from ...utils.logger import log_node_start, log_node_end, log_info
 
 
+def _read_svg(svg_path: str) -> str:
+    """读取已生成的 SVG 文件"""
+    with open(svg_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+async def _draw_one(
+    drawer: SmartDrawer,
+    section: Section,
+    svg_dir: str,
+    completed_svgs: Dict[str, Dict[str, str]],
+    thread_id: str,
+    progress: str,
+    limiter: AIMDLimiter,
+    progress_path: str,
+) -> SVGResult:
+    """
+    绘制单个章节（重试与备用 SVG 由 SmartDrawer.adraw 负责）
+
+    Args:
+        drawer: 共享的智能绘图器
+        section: 待绘制章节
+        svg_dir: SVG 输出目录
+        completed_svgs: 断点续跑已完成映射（序号:标题 -> {svg_path, content_hash}）
+        thread_id: 线程 ID（日志用）
+        progress: 进度标记（如 "3/20"，日志用）
+        limiter: 自适应并发限制器（复用的章节不占用名额）
+        progress_path: 逐章节进度记录路径（成功后追加，崩溃后续跑可用）
+
+    Returns:
+        SVGResult 对象（异常时返回失败结果，不中断其他章节）
+    """
+    # 断点续跑：上次已成功、内容未修改且文件仍在，直接复用
+    completed = completed_svgs.get(Section.resume_key(section.index, section.title))
+    if (completed and completed["content_hash"] == section.content_hash()
+            and os.path.exists(completed["svg_path"])):
+        completed_path = completed["svg_path"]
+        try:
+            svg_content = await asyncio.to_thread(_read_svg, completed_path)
+        except (OSError, UnicodeDecodeError) as e:
+            # 上次的文件已损坏或不可读：重新绘制，不影响其他章节
+            log_info("draw_svg", thread_id, f"复用失败，重新绘制: {completed_path}: {e}")
+        else:
+            log_info("draw_svg", thread_id, f"已完成，跳过: {completed_path}")
+            return SVGResult(
+                section_index=section.index,
+                section_title=section.title,
+                svg_content=svg_content,
+                svg_path=completed_path,
+                success=True
+            )
+
+    log_info("draw_svg", thread_id, f"进度: {progress} | 当前章节: {section.title}")
+    log_info("draw_svg", thread_id, f"层级路径: {section.hierarchy_path}")
+    try:
+        result = await drawer.adraw(section, svg_dir, limiter)
+    except Exception as e:
+        log_info("draw_svg", thread_id, f"错误: {section.title}: {e}")
+        return SVGResult(
+            section_index=section.index,
+            section_title=section.title,
+            svg_content="",
+            svg_path="",
+            success=False,
+            error_message=str(e)
+        )
+
+    if result.success:
+        log_info("draw_svg", thread_id, f"成功: {result.svg_path}")
+        # SVG 已原子写入，立即记录进度：未写出报告就中断时，续跑也能跳过本章节
+        try:
+            await asyncio.to_thread(append_jsonl, progress_path, {
+                "index": section.index,
+                "title": section.title,
+                "content_hash": section.content_hash(),
+                "svg_path": result.svg_path,
+            })
+        except OSError as e:
+            log_info("draw_svg", thread_id, f"进度记录写入失败: {e}")
+    else:
+        log_info("draw_svg", thread_id, f"失败（使用备用）: {result.error_message}")
+    return result
+
+
+async def _draw_all(
+    drawer: SmartDrawer,
+    sections: List[Section],
+    svg_dir: str,
+    completed_svgs: Dict[str, Dict[str, str]],
+    thread_id: str,
+    llm_config: Dict[str, Any],
+    progress_path: str,
+) -> List[SVGResult]:
+    """
+    并发绘制全部章节，结果顺序与 sections 一致
+
+    Args:
+        drawer: 共享的智能绘图器
+        sections: 待绘制章节列表
+        svg_dir: SVG 输出目录
+        completed_svgs: 断点续跑已完成映射
+        thread_id: 线程 ID（日志用）
+        llm_config: LLM 配置（max_concurrency / min_concurrency / latency_target）
+        progress_path: 逐章节进度记录路径
+
+    Returns:
+        SVGResult 列表
+    """
+    limiter = AIMDLimiter(
+        max_limit=llm_config.get("max_concurrency", 8),
+        min_limit=llm_config.get("min_concurrency", 1),
+        latency_target=llm_config.get("latency_target", 90.0),
+    )
+
+    # 固定数量的常驻 worker 从队列取章节，任务对象数为 O(并发上限) 而非 O(章节数)
+    queue: "asyncio.Queue[int]" = asyncio.Queue()
+    total = len(sections)
+    for idx in range(total):
+        queue.put_nowait(idx)
+    results: List[Optional[SVGResult]] = [None] * len(sections)
+
+    async def worker() -> None:
+        while not queue.empty():
+            idx = queue.get_nowait()
+            # 并发名额由 adraw 按每次 LLM 请求占用，拥塞错误收缩、成功且不慢时逐步放开
+            results[idx] = await _draw_one(
+                drawer, sections[idx], svg_dir, completed_svgs, thread_id,
+                f"{idx + 1}/{total}", limiter, progress_path
+            )
+
+    worker_count = min(limiter.max_limit, len(sections))
+    await asyncio.gather(*(worker() for _ in range(worker_count)))
+    return results
+
+
 @register_node("draw_svg")
 def draw_svg(state: WorkflowState) -> Dict[str, Any]:
     """
     SVG 绘图节点
 
+    一次处理 current_section_idx 之后的全部章节（扇出并发），
+    完成后 current_section_idx 指向末尾，随后进入 generate_report。
+
     Args:
         state: 工作流状态
 
@@ -38,53 +179,50 @@ def draw_svg(state: WorkflowState) -> Dict[str, Any]:
     if current_idx >= len(sections):
         return {"svg_results": []}
 
-    section = sections[current_idx]
+    pending = sections[current_idx:]
     log_node_start("draw_svg", thread_id)
-    log_info("draw_svg", thread_id, f"正在生成: {section.title}")
 
     try:
-        # 从 config_path 重新创建配置管理器（避免序列化问题）
-        config_manager = ConfigManager(state["config_path"])
+        # 按 config_path 获取共享配置管理器（state 中不存对象，避免序列化问题）
+        # 热重载时 YAML 出错或配置文件缺失同样落入下方失败分支，不中断工作流
+        config_manager = ConfigManager.shared(state["config_path"])
+        llm_config = config_manager.get_llm_config()
+        svg_dir = config_manager.get_output_config().get('svg_dir', 'output/svgs')
 
-        # 创建智能绘图器
+        # 所有章节共享一个绘图器（同一 LLM 客户端与熔断器）
         drawer = SmartDrawer(config_manager)
-
-        # 获取 SVG 输出目录
-        output_config = config_manager.get_output_config()
-        svg_dir = output_config.get('svg_dir', 'output/svgs')
-
-        # 生成 SVG
-        result = drawer.draw(section, svg_dir)
-
-        if result.success:
-            log_info("draw_svg", thread_id, f"成功: {result.svg_path}")
-            log_node_end("draw_svg", thread_id, success=True)
-        else:
-            log_info("draw_svg", thread_id, f"失败（使用备用）: {result.error_message}")
-            log_node_end("draw_svg", thread_id, success=False)
-
-        # 返回结果列表（LangGraph 会自动追加）和递增的索引
-        return {
-            "svg_results": [result],
-            "current_section_idx": current_idx + 1
-        }
-
     except Exception as e:
         error_msg = str(e)
         log_node_end("draw_svg", thread_id, success=False)
         log_info("draw_svg", thread_id, f"错误: {error_msg}")
 
-        # 记录失败结果
-        error_result = SVGResult(
-            section_index=section.index,
-            section_title=section.title,
-            svg_content="",
-            svg_path="",
-            success=False,
-            error_message=error_msg
-        )
-
+        # 绘图器不可用：全部章节记录失败结果
         return {
-            "svg_results": [error_result],
-            "current_section_idx": current_idx + 1
+            "svg_results": [
+                SVGResult(
+                    section_index=section.index,
+                    section_title=section.title,
+                    svg_content="",
+                    svg_path="",
+                    success=False,
+                    error_message=error_msg
+                )
+                for section in pending
+            ],
+            "current_section_idx": len(sections)
         }
+
+    log_info("draw_svg", thread_id,
+             f"并发绘制 {len(pending)} 个章节（并发上限 {llm_config.get('max_concurrency', 8)}）")
+    results = asyncio.run(_draw_all(
+        drawer, pending, svg_dir, state["completed_svgs"], thread_id, llm_config,
+        state["progress_path"]
+    ))
+
+    log_node_end("draw_svg", thread_id, success=all(r.success for r in results))
+
+    # 返回结果列表（LangGraph 会自动追加）和末尾索引
+    return {
+        "svg_results": results,
+        "current_section_idx": len(sections)
+    }
@@ -10,11 +10,12 @@
 """
 
 import json
+import os
 from datetime import datetime
 from typing import Dict, Any
 
 from ...agents.state import WorkflowState
-from ...utils import register_node
+from ...utils import atomic_write, register_node
 from ...utils.logger import log_node_start, log_node_end, log_info
 
 
@@ -33,10 +34,28 @@ def generate_report(state: WorkflowState) -> Dict[str, Any]:
     log_node_start("generate_report", thread_id)
 
     try:
-        # 统计信息
+        # 单次遍历：同时统计成功数并构建章节详情
         svg_results = state["svg_results"]
+        sections_by_index = {section.index: section for section in state["sections"]}
         total = len(svg_results)
-        success_count = sum(1 for r in svg_results if r.success)
+        success_count = 0
+        section_entries = []
+
+        for result in svg_results:
+            if result.success:
+                success_count += 1
+            section = sections_by_index.get(result.section_index)
+            section_entries.append({
+                "index": result.section_index,
+                "title": result.section_title,
+                # 断点续跑据此判断章节内容是否改动
+                "content_hash": section.content_hash() if section else "",
+                "svg_path": result.svg_path,
+                "success": result.success,
+                "error_message": result.error_message if not result.success else "",
+                "timestamp": result.timestamp
+            })
+
         failed_count = total - success_count
 
         # 构建报告数据
@@ -49,24 +68,18 @@ def generate_report(state: WorkflowState) -> Dict[str, Any]:
                 "failed_count": failed_count,
                 "success_rate": f"{success_count/total*100:.1f}%" if total > 0 else "0%"
             },
-            "sections": []
+            "sections": section_entries
         }
 
-        # 添加章节详情
-        for result in svg_results:
-            report["sections"].append({
-                "index": result.section_index,
-                "title": result.section_title,
-                "svg_path": result.svg_path,
-                "success": result.success,
-                "error_message": result.error_message if not result.success else "",
-                "timestamp": result.timestamp
-            })
-
-        # 保存报告
+        # 保存报告（原子写入：断点续跑依赖该文件，不能留下半个 JSON）
         report_path = state["report_path"]
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        atomic_write(report_path, json.dumps(report, ensure_ascii=False, indent=2))
+
+        # 报告已覆盖全部章节，逐章节进度记录不再需要
+        try:
+            os.remove(state["progress_path"])
+        except FileNotFoundError:
+            pass
 
         log_info("generate_report", thread_id, f"报告已保存: {report_path}")
         log_info("generate_report", thread_id,
@@ -6,18 +6,44 @@
 职责：
 1. 加载配置，创建 ConfigManager
 2. 创建输出目录
-3. 初始化状态
+3. 断点续跑时读取上次报告与逐章节进度记录中已成功的章节
+4. 初始化状态
 """
 
+import json
 import os
-from typing import Dict, Any
+from typing import Any, Dict, Iterable
 
-from ...agents.state import WorkflowState
+from ...agents.state import Section, WorkflowState
 from ...config import ConfigManager
 from ...utils import register_node
 from ...utils.logger import log_node_start, log_node_end, log_info
 
 
+def _completed_entries(report_path: str, progress_path: str) -> Iterable[Dict[str, Any]]:
+    """
+    依次产出上次报告与进度记录中的成功章节条目（进度记录在后，覆盖报告中的同键条目）
+
+    Args:
+        report_path: 上次 JSON 报告路径
+        progress_path: 逐章节进度记录路径（崩溃后可能只有它，末行可能不完整）
+    """
+    if os.path.exists(report_path):
+        with open(report_path, 'r', encoding='utf-8') as f:
+            for entry in json.load(f).get("sections", []):
+                if entry.get("success"):
+                    yield entry
+
+    if os.path.exists(progress_path):
+        with open(progress_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # 崩溃时写了一半的行，跳过
+                    continue
+
+
 @register_node("initialize")
 def initialize(state: WorkflowState) -> Dict[str, Any]:
     """
@@ -33,29 +59,52 @@ def initialize(state: WorkflowState) -> Dict[str, Any]:
     log_node_start("initialize", thread_id)
 
     try:
-        # 创建配置管理器
-        config_manager = ConfigManager(state["config_path"])
+        # 获取共享配置管理器（后续节点按同一 config_path 复用）
+        config_manager = ConfigManager.shared(state["config_path"])
 
         # 获取输出配置
         output_config = config_manager.get_output_config()
         output_dir = os.path.dirname(output_config.get('report_file', 'output/report.json'))
         svg_dir = output_config.get('svg_dir', 'output/svgs')
         report_path = output_config.get('report_file', 'output/report.json')
+        progress_path = output_config.get('progress_file', 'output/.progress.jsonl')
 
         # 创建输出目录
         os.makedirs(output_dir, exist_ok=True)
         os.makedirs(svg_dir, exist_ok=True)
 
+        # 断点续跑：上次报告及进度记录中成功的章节在 draw_svg 中直接复用，不再调用 LLM
+        # 按 序号+标题 建键（标题可能重复），并记录内容摘要供 draw_svg 比对
+        completed_svgs = {}
+        if output_config.get('resume', False):
+            try:
+                completed_svgs = {
+                    Section.resume_key(entry["index"], entry["title"]): {
+                        "svg_path": entry["svg_path"],
+                        "content_hash": entry["content_hash"],
+                    }
+                    for entry in _completed_entries(report_path, progress_path)
+                    if entry.get("svg_path") and entry.get("content_hash")
+                }
+                log_info("initialize", thread_id, f"断点续跑: 已完成 {len(completed_svgs)} 个章节")
+            except (OSError, ValueError, KeyError) as e:
+                log_info("initialize", thread_id, f"上次记录无法读取，全部重新生成: {e}")
+        elif os.path.exists(progress_path):
+            # 不续跑：清除旧进度记录，本次从头记录
+            os.remove(progress_path)
+
         log_info("initialize", thread_id, f"配置加载成功: {state['config_path']}")
         log_info("initialize", thread_id, f"输出目录: {output_dir}")
         log_info("initialize", thread_id, f"SVG目录: {svg_dir}")
         log_node_end("initialize", thread_id, success=True)
 
         # 注意：不把 config_manager 存入 state（LangGraph 无法序列化）
-        # 在 draw_svg 节点中会根据 config_path 重新创建
+        # 在 draw_svg 节点中会根据 config_path 获取共享实例
         return {
             "output_dir": output_dir,
             "report_path": report_path,
+            "progress_path": progress_path,
+            "completed_svgs": completed_svgs,
         }
 
     except Exception as e:
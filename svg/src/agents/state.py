@@ -7,17 +7,25 @@ Rule 5: LangGraph 状态机原则
 必须使用 TypedDict，禁止随意 dict 传参
 """
 
+import hashlib
 import operator
-from dataclasses import dataclass, field
+import sys
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Annotated, List, Optional, TypedDict
+from typing import Annotated, Dict, List, Optional, TypedDict
 
 
 # =============================================================================
 # 数据模型（用于非状态字段的复杂对象）
+# 不可变（frozen），可在并发绘制任务间安全共享；Python 3.10+ 启用 __slots__ 省去实例 __dict__
 # =============================================================================
 
-@dataclass
+_DATACLASS_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Section:
     """
     文档章节数据类
@@ -35,15 +43,27 @@ class Section:
 
     def to_dict(self) -> dict:
         """序列化为字典（用于 JSON 报告）"""
-        return {
-            "index": self.index,
-            "title": self.title,
-            "content": self.content,
-            "hierarchy_path": self.hierarchy_path,
-        }
+        return asdict(self)
+
+    def content_hash(self) -> str:
+        """
+        章节内容摘要（标题、层级路径、正文）
+
+        断点续跑时与上次报告中的摘要比对，内容被修改过的章节不复用旧 SVG。
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.title, self.hierarchy_path, self.content):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @staticmethod
+    def resume_key(index: int, title: str) -> str:
+        """断点续跑映射键（标题可能重复，需与序号组合）"""
+        return f"{index}:{title}"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SVGResult:
     """
     SVG 生成结果数据类
@@ -98,10 +118,12 @@ class WorkflowState(TypedDict):
         sections: 拆分后的 Section 对象列表
         split_success: 文档拆分是否成功
         split_error: 拆分错误信息
-        current_section_idx: 当前绘图章节索引
+        current_section_idx: 绘图起始章节索引（draw_svg 从此处起处理剩余章节）
         svg_results: SVG 生成结果列表（追加模式）
+        completed_svgs: 断点续跑时上次已成功的章节（序号:标题 -> {svg_path, content_hash}）
         output_dir: 输出根目录
         report_path: JSON 报告保存路径
+        progress_path: 逐章节进度记录（JSON Lines）路径
         workflow_success: 工作流整体是否成功
         error_message: 全局错误信息
     """
@@ -119,9 +141,12 @@ class WorkflowState(TypedDict):
     current_section_idx: int
     # svg_results 使用 operator.add 实现追加语义（每节点返回新项即可）
     svg_results: Annotated[List[SVGResult], operator.add]
+    # 断点续跑：上次运行已成功生成的章节
+    completed_svgs: Dict[str, Dict[str, str]]
     # 输出配置
     output_dir: str
     report_path: str
+    progress_path: str
     # 最终状态
     workflow_success: bool
     error_message: str
@@ -155,8 +180,10 @@ def create_initial_state(
         "split_error": "",
         "current_section_idx": 0,
         "svg_results": [],
+        "completed_svgs": {},
         "output_dir": "output",
         "report_path": "output/report.json",
+        "progress_path": "output/.progress.jsonl",
         "workflow_success": False,
         "error_message": "",
     }
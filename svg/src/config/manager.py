@@ -16,8 +16,10 @@ Rule 3：提示词文件化，system/user/examples 分离，Jinja2 变量渲染
 """
 
 import os
+import threading
+import time
 import yaml
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, ClassVar, Dict, Optional, Tuple
 from jinja2 import Template, Environment, BaseLoader
 
 
@@ -37,8 +39,16 @@ class ConfigManager:
         config_data: 解析后的完整配置字典
         _file_mtimes: 各配置文件的最后修改时间（用于热重载检测）
         _jinja_env: Jinja2 环境
+        _prompts_cache: load_prompts 结果缓存，键为三个提示词文件的 (路径, mtime)
+        _compiled_prompts: (源文本, 已编译模板) 缓存，源文本不变时重载配置也不重新编译
+        _prompts_dirty: 配置重载后置位，下次渲染时重新核对提示词源文本
+        _llm_config_flat: 加载时展平的 LLM 配置（不含 api_key）
     """
 
+    # 按配置路径共享的实例（见 shared()）
+    _shared_instances: ClassVar[Dict[str, "ConfigManager"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, config_path: str = "config/standard.yaml") -> None:
         """
         初始化配置管理器并立即加载配置
@@ -54,8 +64,40 @@ class ConfigManager:
         self.config_data: Dict[str, Any] = {}
         self._file_mtimes: Dict[str, float] = {}
         self._jinja_env = Environment(loader=BaseLoader())
+        self._prompts_cache: Optional[Tuple[Tuple[Any, ...], Tuple[str, str]]] = None
+        self._compiled_prompts: Optional[Tuple[Tuple[str, str], Tuple[Template, Template]]] = None
+        self._prompts_dirty: bool = True
+        self._llm_config_flat: Dict[str, Any] = {}
+        self._llm_api_key_env: str = ""
+        # 热重载检查节流：两次检查的最小间隔（秒），由 hot_reload.interval 配置
+        self._reload_interval: float = 0.0
+        self._last_reload_check: float = 0.0
         self._load_config()
 
+    @classmethod
+    def shared(cls, config_path: str = "config/standard.yaml") -> "ConfigManager":
+        """
+        获取按配置路径共享的配置管理器
+
+        各节点按 config_path 重新获取配置管理器（state 中不能存放对象），
+        共享实例避免每个节点、每个章节重复读取和解析 YAML；
+        配置变更仍由 reload_if_changed() 热重载，共享不影响热重载语义。
+
+        Args:
+            config_path: YAML 配置文件路径
+
+        Returns:
+            该路径对应的 ConfigManager 实例
+        """
+        with cls._shared_lock:
+            instance = cls._shared_instances.get(config_path)
+            if instance is None:
+                instance = cls(config_path)
+                cls._shared_instances[config_path] = instance
+            else:
+                instance.reload_if_changed()
+            return instance
+
     # ------------------------------------------------------------------
     # 配置加载与热重载
     # ------------------------------------------------------------------
@@ -72,6 +114,14 @@ class ConfigManager:
         with open(self.config_path, "r", encoding="utf-8") as f:
             self.config_data = yaml.safe_load(f)
 
+        # 配置或提示词可能已变更，下次渲染时重新核对提示词源文本
+        self._prompts_dirty = True
+        # 嵌套的 LLM 配置只在加载时展平一次
+        self._llm_config_flat, self._llm_api_key_env = self._flatten_llm_config()
+        self._reload_interval = float(
+            self.config_data.get("hot_reload", {}).get("interval", 2.0)
+        )
+
         # 记录主配置文件 mtime
         self._file_mtimes[self.config_path] = os.path.getmtime(self.config_path)
 
@@ -86,19 +136,29 @@ class ConfigManager:
         """
         检查所有被追踪文件是否发生变化，若有则重新加载
 
-        支持热重载：配置文件或提示词文件修改后无需重启
+        支持热重载：配置文件或提示词文件修改后无需重启。
+        两次检查间隔小于 hot_reload.interval 秒时直接返回 False，
+        每个文件只做一次 os.stat，发现第一个变更即停止检查。
 
         Returns:
             True 表示执行了重新加载，False 表示无变化
         """
-        needs_reload = any(
-            os.path.exists(fp) and os.path.getmtime(fp) > mtime
-            for fp, mtime in self._file_mtimes.items()
-        )
-        if needs_reload:
-            self._load_config()
-            return True
-        return False
+        now = time.monotonic()
+        if now - self._last_reload_check < self._reload_interval:
+            return False
+        self._last_reload_check = now
+
+        for fp, mtime in self._file_mtimes.items():
+            try:
+                if os.stat(fp).st_mtime > mtime:
+                    break
+            except FileNotFoundError:
+                continue
+        else:
+            return False
+
+        self._load_config()
+        return True
 
     # ------------------------------------------------------------------
     # 配置获取
@@ -125,7 +185,22 @@ class ConfigManager:
 
         Returns:
             包含 base_url / api_key / model / temperature / max_tokens /
-            retry_times / retry_base_delay 的扁平化配置字典
+            retry_times / retry_base_delay / retry_max_delay / circuit_* /
+            response_cache_size / *_concurrency / latency_target /
+            rpm_limit 的扁平化配置字典
+        """
+        # 嵌套配置已在加载时展平，这里只读取环境变量（API Key 可能在运行中变更）
+        return {
+            **self._llm_config_flat,
+            "api_key": os.environ.get(self._llm_api_key_env, ""),
+        }
+
+    def _flatten_llm_config(self) -> Tuple[Dict[str, Any], str]:
+        """
+        展平当前激活后端的 LLM 配置（配置加载时调用一次）
+
+        Returns:
+            (不含 api_key 的扁平化配置字典, API Key 环境变量名) 元组
         """
         llm_root = self.config_data.get("llm", {})
         backend = llm_root.get("backend", "dashscope")
@@ -133,21 +208,31 @@ class ConfigManager:
         # 取对应后端子配置
         backend_cfg: Dict[str, Any] = llm_root.get(backend, {})
 
-        # 从环境变量读取 API Key（禁止硬编码）
+        # API Key 环境变量名（禁止硬编码密钥）
         env_var: str = backend_cfg.get("api_key_env", "")
-        api_key: str = os.environ.get(env_var, "")
 
         return {
             "backend": backend,
             "base_url": backend_cfg.get("base_url", ""),
-            "api_key": api_key,
             "model": backend_cfg.get("model", "qwen-max"),
             "temperature": backend_cfg.get("temperature", 0.3),
             "max_tokens": backend_cfg.get("max_tokens", 4096),
             # 通用重试参数
             "retry_times": llm_root.get("retry_times", 2),
             "retry_base_delay": llm_root.get("retry_base_delay", 1.0),
-        }
+            "retry_max_delay": llm_root.get("retry_max_delay", 30.0),
+            # 熔断参数
+            "circuit_fail_threshold": llm_root.get("circuit_fail_threshold", 5),
+            "circuit_reset_timeout": llm_root.get("circuit_reset_timeout", 60.0),
+            # 相同提示词的 SVG 结果缓存容量（0 表示关闭）
+            "response_cache_size": llm_root.get("response_cache_size", 128),
+            # 章节并发绘制（AIMD 自适应）
+            "max_concurrency": llm_root.get("max_concurrency", 8),
+            "min_concurrency": llm_root.get("min_concurrency", 1),
+            "latency_target": llm_root.get("latency_target", 90.0),
+            # 每分钟请求数上限（0 表示不限速）
+            "rpm_limit": llm_root.get("rpm_limit", 0),
+        }, env_var
 
     # ------------------------------------------------------------------
     # 提示词加载与渲染（Rule 3）
@@ -165,6 +250,8 @@ class ConfigManager:
            system + "\n\n## 示例\n" + examples
         5. 返回 (system, user) 元组（未渲染变量）
 
+        三个文件的 (路径, mtime) 均未变化时直接返回上次结果，不再读取文件。
+
         Returns:
             (system_prompt_template, user_prompt_template) 元组
 
@@ -176,26 +263,65 @@ class ConfigManager:
         user_file: str = prompts_cfg.get("user_file", "prompts/user.txt")
         examples_file: str = prompts_cfg.get("examples_file", "prompts/examples.txt")
 
+        # 每个文件一次 os.stat，缺失文件的 mtime 记为 None
+        cache_key = tuple(
+            (fp, self._stat_mtime(fp)) for fp in (system_file, user_file, examples_file)
+        )
+        if self._prompts_cache is not None and self._prompts_cache[0] == cache_key:
+            return self._prompts_cache[1]
+        system_mtime, user_mtime, examples_mtime = (mtime for _, mtime in cache_key)
+
         # 读取 system 提示词
-        if not os.path.exists(system_file):
+        if system_mtime is None:
             raise FileNotFoundError(f"系统提示词文件不存在: {system_file}")
         with open(system_file, "r", encoding="utf-8") as f:
             system_prompt = f.read()
 
         # 读取 user 提示词模板
-        if not os.path.exists(user_file):
+        if user_mtime is None:
             raise FileNotFoundError(f"用户提示词文件不存在: {user_file}")
         with open(user_file, "r", encoding="utf-8") as f:
             user_prompt = f.read()
 
         # 读取 examples 并拼接（可选）
-        if os.path.exists(examples_file):
+        if examples_mtime is not None:
             with open(examples_file, "r", encoding="utf-8") as f:
                 examples_content = f.read()
             if examples_content.strip():
                 system_prompt = f"{system_prompt}\n\n## 示例\n{examples_content}"
 
-        return system_prompt, user_prompt
+        prompts = (system_prompt, user_prompt)
+        self._prompts_cache = (cache_key, prompts)
+        return prompts
+
+    @staticmethod
+    def _stat_mtime(fp: str) -> Optional[float]:
+        """返回文件 mtime，文件不存在时返回 None"""
+        try:
+            return os.stat(fp).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _get_compiled_prompts(self) -> Tuple[Template, Template]:
+        """
+        获取已编译的提示词模板（首次调用时读取文件并编译，之后复用）
+
+        Returns:
+            (system_template, user_template) 已编译的 Jinja2 模板元组
+
+        Raises:
+            FileNotFoundError: system.txt 或 user.txt 不存在
+        """
+        # 配置重载后才核对源文本；源文本未变（load_prompts 命中缓存）时沿用已编译模板
+        if self._prompts_dirty or self._compiled_prompts is None:
+            sources = self.load_prompts()
+            if self._compiled_prompts is None or self._compiled_prompts[0] != sources:
+                self._compiled_prompts = (sources, (
+                    self._jinja_env.from_string(sources[0]),
+                    self._jinja_env.from_string(sources[1]),
+                ))
+            self._prompts_dirty = False
+        return self._compiled_prompts[1]
 
     def render_prompts(
         self,
@@ -234,11 +360,9 @@ class ConfigManager:
             **extra_vars,
         }
 
-        # 加载原始模板
-        system_template, user_template = self.load_prompts()
-
-        # 使用 Jinja2 渲染
-        system_prompt = self._jinja_env.from_string(system_template).render(template_vars)
-        user_prompt = self._jinja_env.from_string(user_template).render(template_vars)
+        # 使用缓存的已编译模板渲染（文件变更时由热重载使缓存失效）
+        system_template, user_template = self._get_compiled_prompts()
+        system_prompt = system_template.render(template_vars)
+        user_prompt = user_template.render(template_vars)
 
         return system_prompt, user_prompt
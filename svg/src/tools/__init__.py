@@ -7,9 +7,29 @@
 """
 
 from .document_splitter import DocumentSplitter
+from .docx_heading_styles import load_heading_levels
+from .docx_paragraph_reader import DocxParagraphReader
+from .fallback_svg import FallbackSVG
+from .llm_client import LLMClient
+from .llm_factory import build_llm
+from .retry_policy import RetryPolicy
 from .smart_drawer import SmartDrawer
+from .svg_path_builder import SVGPathBuilder
+from .svg_postprocessor import SVGPostProcessor
+from .svg_response_cache import SVGResponseCache
+from .svg_validator import SVGValidator
 
 __all__ = [
     "DocumentSplitter",
+    "DocxParagraphReader",
+    "FallbackSVG",
+    "LLMClient",
+    "RetryPolicy",
+    "SVGPathBuilder",
+    "SVGPostProcessor",
+    "SVGResponseCache",
+    "SVGValidator",
     "SmartDrawer",
+    "build_llm",
+    "load_heading_levels",
 ]
@@ -5,15 +5,17 @@
 
 Rule 4: 失败优雅降级原则
 单节点失败不中断整体流程
+
+段落读取（lxml 流式解析、标题样式识别）见 docx_paragraph_reader.py。
 """
 
+import io
 import os
-import re
-from typing import List, Optional, Dict
-from docx import Document
+from typing import Iterator, List, Optional
 
 from ..agents.state import Section
 from ..utils import register_tool
+from .docx_paragraph_reader import DocxParagraphReader
 
 
 @register_tool("document_splitter")
@@ -40,64 +42,22 @@ class DocumentSplitter:
         """
         self.docx_path = docx_path
 
-    def _get_paragraph_style(self, paragraph) -> Optional[str]:
+    def split_by_heading5(self) -> List[Section]:
         """
-        获取段落的样式名称
-
-        Args:
-            paragraph: docx 段落对象
+        按 Heading 5 拆分文档
 
         Returns:
-            样式名称（如"Heading 1"），如果不是标题则返回 None
-        """
-        style_name = paragraph.style.name if paragraph.style else None
-        return style_name
+            Section 对象列表（iter_sections 的全部结果）
 
-    def _is_heading(self, style_name: Optional[str], level: int) -> bool:
-        """
-        检查样式是否为指定级别的标题
-
-        Args:
-            style_name: 样式名称
-            level: 标题级别（1-5）
-
-        Returns:
-            是否匹配
-        """
-        if not style_name:
-            return False
-        # 支持多种命名格式："Heading 1", "Heading1", "标题 1"等
-        patterns = [
-            f"^Heading {level}$",
-            f"^Heading{level}$",
-            f"^标题 {level}$",
-            f"^标题{level}$",
-        ]
-        return any(re.match(pattern, style_name, re.IGNORECASE) for pattern in patterns)
-
-    def _is_any_heading(self, style_name: Optional[str]) -> bool:
-        """
-        检查样式是否为任意级别的标题（Heading 1-5）
-
-        Args:
-            style_name: 样式名称
-
-        Returns:
-            是否为标题样式
+        Raises:
+            FileNotFoundError: 文档不存在
+            Exception: 文档解析错误
         """
-        if not style_name:
-            return False
-        patterns = [
-            r"^Heading [1-5]$",
-            r"^Heading[1-5]$",
-            r"^标题 [1-5]$",
-            r"^标题[1-5]$",
-        ]
-        return any(re.match(pattern, style_name, re.IGNORECASE) for pattern in patterns)
+        return list(self.iter_sections())
 
-    def split_by_heading5(self) -> List[Section]:
+    def iter_sections(self) -> Iterator[Section]:
         """
-        按 Heading 5 拆分文档
+        按 Heading 5 流式拆分文档（解析到章节结束即产出，不等待整个文档）
 
         拆分逻辑：
         1. 遍历文档所有段落
@@ -106,8 +66,8 @@ class DocumentSplitter:
         4. 遇到下一个"Heading 1-5"时，当前章节结束
         5. 层级路径：拼接当前章节所在的上级标题（Heading 1-4），用">"连接
 
-        Returns:
-            Section 对象列表
+        Yields:
+            Section 对象（index 按产出顺序从 0 递增）
 
         Raises:
             FileNotFoundError: 文档不存在
@@ -116,76 +76,57 @@ class DocumentSplitter:
         if not os.path.exists(self.docx_path):
             raise FileNotFoundError(f"文档不存在: {self.docx_path}")
 
-        # 加载文档
-        doc = Document(self.docx_path)
+        index = 0
 
-        sections: List[Section] = []
-        current_section: Optional[Dict] = None
+        # 当前章节（cur_buf 为 None 表示尚未遇到第一个 Heading 5）
+        cur_title = ""
+        cur_path = ""
+        cur_buf: Optional[io.StringIO] = None
 
-        # 层级路径追踪
-        heading_stack: Dict[int, str] = {}  # {level: title}
+        # 层级路径追踪：heading_stack[level] 为该级当前标题（下标 1-5，0 不用）
+        heading_stack: List[Optional[str]] = [None] * 6
 
-        for paragraph in doc.paragraphs:
-            style_name = self._get_paragraph_style(paragraph)
-            text = paragraph.text.strip()
+        # heading_level：Heading 1-5 为 1-5，0 表示正文
+        for heading_level, text in DocxParagraphReader(self.docx_path).iter_paragraphs():
+            text = text.strip()
 
             if not text:
                 continue
 
-            # 检查是否为 Heading 1-5
-            is_heading = False
-            heading_level = 0
-
-            for level in range(1, 6):
-                if self._is_heading(style_name, level):
-                    is_heading = True
-                    heading_level = level
-                    break
-
-            if is_heading:
+            if heading_level:
                 # 更新层级路径
                 heading_stack[heading_level] = text
                 # 清除更低级别的标题
-                for l in list(heading_stack.keys()):
-                    if l > heading_level:
-                        del heading_stack[l]
+                for deeper in range(heading_level + 1, 6):
+                    heading_stack[deeper] = None
 
                 # 如果是 Heading 5，创建新章节
                 if heading_level == 5:
                     # 先保存当前章节（如果存在）
-                    if current_section:
-                        sections.append(Section(
-                            index=len(sections),
-                            title=current_section['title'],
-                            content='\n'.join(current_section['content']),
-                            hierarchy_path=current_section['hierarchy_path']
-                        ))
-
-                    # 构建层级路径（Heading 1-4）
-                    hierarchy_parts = []
-                    for l in range(1, 5):
-                        if l in heading_stack:
-                            hierarchy_parts.append(heading_stack[l])
-                    hierarchy_path = '>'.join(hierarchy_parts) if hierarchy_parts else ""
-
-                    # 创建新章节
-                    current_section = {
-                        'title': text,
-                        'content': [],
-                        'hierarchy_path': hierarchy_path
-                    }
-            else:
-                # 非标题段落，添加到当前章节内容
-                if current_section is not None:
-                    current_section['content'].append(text)
+                    if cur_buf is not None:
+                        yield Section(
+                            index=index,
+                            title=cur_title,
+                            content=cur_buf.getvalue(),
+                            hierarchy_path=cur_path
+                        )
+                        index += 1
+
+                    # 创建新章节，层级路径拼接 Heading 1-4
+                    cur_title = text
+                    cur_path = '>'.join(h for h in heading_stack[1:5] if h)
+                    cur_buf = io.StringIO()
+            elif cur_buf is not None:
+                # 非标题段落，追加到当前章节内容缓冲（段落间以换行分隔）
+                if cur_buf.tell():
+                    cur_buf.write('\n')
+                cur_buf.write(text)
 
         # 保存最后一个章节
-        if current_section:
-            sections.append(Section(
-                index=len(sections),
-                title=current_section['title'],
-                content='\n'.join(current_section['content']),
-                hierarchy_path=current_section['hierarchy_path']
-            ))
-
-        return sections
+        if cur_buf is not None:
+            yield Section(
+                index=index,
+                title=cur_title,
+                content=cur_buf.getvalue(),
+                hierarchy_path=cur_path
+            )
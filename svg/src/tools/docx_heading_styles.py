@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+docx 标题样式识别工具
+
+从 word/styles.xml 构建段落样式 ID -> 标题级别映射，
+遍历段落时仅凭 pStyle 的样式 ID 查表。
+"""
+
+import zipfile
+from typing import Dict, Tuple
+
+from lxml import etree
+
+from ..utils import register_tool
+
+# 标题样式名 -> 级别（小写键）：支持 "Heading 1" / "Heading1" / "标题 1" / "标题1"
+# 合法写法是固定的有限集合，查表替代正则匹配
+_HEADING_LEVELS: Dict[str, int] = {
+    f"{prefix}{sep}{level}": level
+    for prefix in ("heading", "标题")
+    for sep in ("", " ")
+    for level in range(1, 6)
+}
+
+# WordprocessingML 命名空间与用到的标签/属性（Clark 记法）
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_STYLE = f"{_W}style"
+_W_STYLE_ID = f"{_W}styleId"
+_W_NAME = f"{_W}name"
+_W_VAL = f"{_W}val"
+_W_TYPE = f"{_W}type"
+_W_DEFAULT = f"{_W}default"
+
+
+@register_tool("docx_heading_styles")
+def load_heading_levels(docx: zipfile.ZipFile) -> Tuple[Dict[str, int], int]:
+    """
+    从 word/styles.xml 构建段落样式 ID -> 标题级别映射（每个文档只读一次）
+
+    样式名只在这里查表解析一次（一次查表覆盖 Heading 1-5 全部写法）；
+    遍历段落时仅凭 pStyle 的样式 ID 查表，正文段落不再做任何样式名处理。
+
+    Args:
+        docx: 已打开的 docx 压缩包
+
+    Returns:
+        (样式 ID -> 标题级别（仅含 Heading 1-5）, 默认段落样式的标题级别) 元组
+    """
+    heading_levels: Dict[str, int] = {}
+    default_level = 0
+    try:
+        styles_xml = docx.read("word/styles.xml")
+    except KeyError:
+        return heading_levels, default_level
+
+    for style in etree.fromstring(styles_xml).iterchildren(_W_STYLE):
+        if style.get(_W_TYPE) != "paragraph":
+            continue
+        style_id = style.get(_W_STYLE_ID)
+        name = style.find(_W_NAME)
+        if style_id is None or name is None:
+            continue
+        style_name = name.get(_W_VAL) or ""
+        level = _HEADING_LEVELS.get(style_name.strip().lower(), 0)
+        if level:
+            heading_levels[style_id] = level
+        if style.get(_W_DEFAULT) in ("1", "true", "on"):
+            default_level = level
+    return heading_levels, default_level
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+docx 段落读取工具
+
+直接用 lxml.iterparse 流式读取 word/document.xml，按样式 ID 识别 Heading 1-5（映射见 docx_heading_styles.py），
+供 DocumentSplitter 按章节拆分。
+"""
+
+import zipfile
+from typing import Dict, Iterator, List, Tuple
+
+from lxml import etree
+
+from ..utils import register_tool
+from .docx_heading_styles import load_heading_levels
+
+# WordprocessingML 命名空间与常用标签（Clark 记法）
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_R = f"{_W}r"
+_W_HYPERLINK = f"{_W}hyperlink"
+_W_VAL = f"{_W}val"
+# 段落样式引用路径：w:p/w:pPr/w:pStyle/@w:val
+_W_PSTYLE_PATH = f"{_W}pPr/{_W}pStyle"
+# run 子元素 -> 文本（与 python-docx Run.text 一致）
+_W_T = f"{_W}t"
+_W_BR = f"{_W}br"
+_W_TYPE = f"{_W}type"
+_RUN_CHAR_TEXT: Dict[str, str] = {
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+
+
+@register_tool("docx_paragraph_reader")
+class DocxParagraphReader:
+    """
+    docx 顶层段落流式读取器
+
+    Attributes:
+        docx_path: Word 文档路径
+    """
+
+    def __init__(self, docx_path: str):
+        """
+        初始化段落读取器
+
+        Args:
+            docx_path: Word 文档路径
+        """
+        self.docx_path = docx_path
+
+    @staticmethod
+    def _paragraph_text(p) -> str:
+        """
+        提取段落文本（与 python-docx Paragraph.text 一致：仅直接 run 与超链接内 run）
+
+        Args:
+            p: <w:p> 元素
+
+        Returns:
+            段落文本
+        """
+        parts: List[str] = []
+        for child in p.iterchildren(_W_R, _W_HYPERLINK):
+            runs = child.iterchildren(_W_R) if child.tag == _W_HYPERLINK else (child,)
+            for run in runs:
+                for item in run.iterchildren():
+                    tag = item.tag
+                    if tag == _W_T:
+                        parts.append(item.text or "")
+                    elif tag == _W_BR:
+                        if item.get(_W_TYPE) in (None, "textWrapping"):
+                            parts.append("\n")
+                    elif tag in _RUN_CHAR_TEXT:
+                        parts.append(_RUN_CHAR_TEXT[tag])
+        return "".join(parts)
+
+    def iter_paragraphs(self) -> Iterator[Tuple[int, str]]:
+        """
+        流式遍历正文顶层段落
+
+        直接用 lxml.iterparse 读取 word/document.xml，不构建 python-docx 对象树；
+        覆盖范围与 doc.paragraphs 一致（body 的直接 <w:p> 子元素，不含表格内段落），
+        处理完的段落及其之前的兄弟节点立即释放。
+
+        Yields:
+            (标题级别, 段落文本) 元组；级别 0 表示正文，未设置样式时取默认段落样式
+        """
+        with zipfile.ZipFile(self.docx_path) as docx:
+            heading_levels, default_level = load_heading_levels(docx)
+
+            with docx.open("word/document.xml") as stream:
+                for _, p in etree.iterparse(stream, events=("end",), tag=_W_P):
+                    parent = p.getparent()
+                    if parent is None or parent.tag != _W_BODY:
+                        continue
+
+                    pstyle = p.find(_W_PSTYLE_PATH)
+                    if pstyle is None:
+                        level = default_level
+                    else:
+                        level = heading_levels.get(pstyle.get(_W_VAL), 0)
+                    yield level, self._paragraph_text(p)
+
+                    # 释放已处理内容：清空本段，并删除 body 下之前的兄弟节点
+                    # （已清空的段落壳、表格等），树的常驻大小与文档长度无关
+                    p.clear()
+                    while p.getprevious() is not None:
+                        del parent[0]
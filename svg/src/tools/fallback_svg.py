@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+备用 SVG 工具
+
+Rule 4: 失败优雅降级原则
+LLM 调用失败或响应无法修复时，生成极简占位 SVG 与对应的失败原因。
+"""
+
+import html
+
+from ..utils import register_tool
+
+# 备用 SVG 骨架（硬编码备用样式：背景 #FFFFFF、文字 #1A2B4C、主色 #1E5FC5），仅 {title} 需填充
+_FALLBACK_SVG_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 600" width="800" height="600">
+  <rect width="800" height="600" fill="#FFFFFF"/>
+  <rect x="50" y="50" width="700" height="500" rx="10" fill="none" stroke="#1E5FC5" stroke-width="2"/>
+  <text x="400" y="280" text-anchor="middle" font-family="Arial, sans-serif" font-size="24" fill="#1A2B4C">
+    {title}
+  </text>
+  <text x="400" y="320" text-anchor="middle" font-family="Arial, sans-serif" font-size="14" fill="#1E5FC5">
+    [SVG生成失败 - 备用图表]
+  </text>
+</svg>'''
+
+
+@register_tool("fallback_svg")
+class FallbackSVG:
+    """
+    备用 SVG 生成器
+
+    无状态，SmartDrawer 持有一个实例复用。
+    """
+
+    @staticmethod
+    def generate(title: str) -> str:
+        """
+        生成极简备用 SVG
+
+        Args:
+            title: 章节标题
+
+        Returns:
+            备用 SVG 代码
+        """
+        # 截断标题（避免过长），并转义 XML 特殊字符（& < > 会破坏 SVG）
+        display_title = title[:50] + "..." if len(title) > 50 else title
+
+        return _FALLBACK_SVG_TEMPLATE.format_map({"title": html.escape(display_title)})
+
+    @staticmethod
+    def error_message(last_error: str, attempts: int, breaker_open: bool) -> str:
+        """
+        生成使用备用 SVG 时的失败原因（按实际调用次数，而非配置的重试上限）
+
+        Args:
+            last_error: 最后一次调用的错误信息
+            attempts: 实际发出的 LLM 调用次数
+            breaker_open: 是否因熔断打开而停止调用
+
+        Returns:
+            失败原因
+        """
+        if attempts == 0:
+            return "LLM服务熔断中，跳过调用"
+        suffix = "，熔断打开后停止重试" if breaker_open else ""
+        return f"LLM调用失败（共调用{attempts}次{suffix}）: {last_error}"
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM 客户端工具
+
+封装 SmartDrawer 的上游调用细节：
+- ChatOpenAI 实例按后端参数复用（见 llm_factory.py）
+- 按 base_url 共享熔断器与 RPM 限速器
+- 每次请求占用一个 AIMD 并发名额，按拥塞信号调整（错误分类见 retry_policy.py）
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from ..utils import AIMDLimiter, CircuitBreaker, SlidingWindowRateLimiter, register_tool
+from .llm_factory import build_llm
+from .retry_policy import RetryPolicy
+
+# 按 base_url 共享的熔断器：上游持续失败时后续章节直接走备用 SVG
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+# 按 base_url 共享的 RPM 限速器：请求发出前排队，避免突发超限换回 429
+_RATE_LIMITERS: Dict[str, SlidingWindowRateLimiter] = {}
+
+
+@register_tool("llm_client")
+class LLMClient:
+    """
+    带熔断、限速与自适应并发的 LLM 客户端
+
+    Attributes:
+        llm: LangChain LLM 实例
+        breaker: 同一后端共享的熔断器
+        rate_limiter: 同一后端共享的 RPM 限速器
+        retry_policy: 重试等待与拥塞判断策略
+    """
+
+    def __init__(self, llm_config: Dict[str, Any]) -> None:
+        """
+        初始化客户端（共享组件按当前配置更新，热重载后立即生效）
+
+        Args:
+            llm_config: ConfigManager.get_llm_config() 返回的扁平化配置
+        """
+        self.retry_policy = RetryPolicy(llm_config)
+
+        backend_key = llm_config.get('base_url') or ''
+        if backend_key not in _BREAKERS:
+            _BREAKERS[backend_key] = CircuitBreaker()
+        self.breaker = _BREAKERS[backend_key]
+        self.breaker.fail_threshold = llm_config.get('circuit_fail_threshold', 5)
+        self.breaker.reset_timeout = llm_config.get('circuit_reset_timeout', 60.0)
+
+        rpm_limit = llm_config.get('rpm_limit', 0)
+        if backend_key not in _RATE_LIMITERS:
+            _RATE_LIMITERS[backend_key] = SlidingWindowRateLimiter(rpm_limit, window=60.0)
+        self.rate_limiter = _RATE_LIMITERS[backend_key]
+        self.rate_limiter.limit = rpm_limit
+
+        # 相同参数复用同一实例及其连接池
+        self.llm = build_llm(
+            model=llm_config.get('model', 'gpt-4o'),
+            temperature=llm_config.get('temperature', 0.3),
+            max_tokens=llm_config.get('max_tokens', 4000),
+            base_url=llm_config.get('base_url'),
+            api_key=llm_config.get('api_key'),
+        )
+
+    @staticmethod
+    def build_messages(system_prompt: str, user_prompt: str) -> List[BaseMessage]:
+        """
+        构建 LLM 消息列表（每个章节构建一次，重试时直接复用）
+
+        Args:
+            system_prompt: 系统提示词
+            user_prompt: 用户提示词
+
+        Returns:
+            [SystemMessage, HumanMessage] 消息列表
+        """
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_prompt)
+        ]
+
+    def allow(self) -> bool:
+        """熔断器是否放行本次调用"""
+        return self.breaker.allow()
+
+    async def ainvoke(
+        self,
+        messages: List[BaseMessage],
+        limiter: Optional[AIMDLimiter] = None
+    ) -> str:
+        """
+        异步调用 LLM，结果记入熔断器；传入 limiter 时请求期间占用一个并发名额
+
+        RPM 等待放在占用名额、开始计时之前：限速睡眠既不占名额，也不被当成上游变慢。
+        拥塞类错误（限流、5xx、超时）收缩并发，鉴权/参数错误与取消只归还名额。
+
+        Args:
+            messages: build_messages 构建的消息列表
+            limiter: 自适应并发限制器（None 表示不限制）
+
+        Returns:
+            LLM 响应文本
+
+        Raises:
+            Exception: LLM 调用失败
+        """
+        delay = self.rate_limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if limiter is not None:
+            await limiter.acquire()
+        started = time.monotonic()
+        success: Optional[bool] = None
+        try:
+            response = await self.llm.ainvoke(messages)
+            success = True
+        except Exception as e:
+            self.breaker.record_failure()
+            success = False if self.retry_policy.is_congestion(e) else None
+            raise
+        finally:
+            if limiter is not None:
+                latency = time.monotonic() - started if success else None
+                await limiter.release(success=success, latency=latency)
+        self.breaker.record_success()
+        return response.content
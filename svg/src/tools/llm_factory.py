@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM 客户端构建工具
+
+Rule 2: 多模型后端兼容原则（OpenRouter / 阿里云百炼 / OpenAI 兼容接口）
+"""
+
+import functools
+from typing import Optional
+
+from langchain_openai import ChatOpenAI
+
+from ..utils import register_tool
+
+
+@register_tool("llm_factory")
+@functools.lru_cache(maxsize=8)
+def build_llm(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    base_url: Optional[str],
+    api_key: Optional[str],
+) -> ChatOpenAI:
+    """
+    构建（并按参数缓存）LLM 客户端
+
+    相同后端参数复用同一个 ChatOpenAI 实例，底层 HTTP 连接池保持长连接，
+    多次运行、多个绘图器之间不再重复建立 TCP/TLS 连接。
+
+    Args:
+        model: 模型名称
+        temperature: 采样温度
+        max_tokens: 最大输出 token 数
+        base_url: API 地址
+        api_key: API 密钥
+
+    Returns:
+        ChatOpenAI 实例
+    """
+    # OpenRouter 需要额外的 headers
+    default_headers = None
+    if 'openrouter.ai' in (base_url or ''):
+        default_headers = {
+            "HTTP-Referer": "https://localhost",
+            "X-Title": "SVG Workflow"
+        }
+
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        base_url=base_url,
+        api_key=api_key,
+        default_headers=default_headers,
+    )
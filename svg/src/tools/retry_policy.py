@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM 重试策略工具
+
+Rule 4: 失败优雅降级原则
+- 重试等待：遵循 Retry-After，否则 full jitter 指数退避
+- 错误分类：不可恢复错误立即放弃；限流/5xx/超时视为拥塞
+"""
+
+import math
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from ..utils import register_tool
+
+# 不可恢复的 HTTP 状态码（鉴权失败、参数错误等），重试无意义
+_UNRECOVERABLE_STATUS = frozenset({400, 401, 403, 404})
+
+# 表示上游限流的 HTTP 状态码（5xx 另按范围判断）
+_THROTTLE_STATUS = 429
+
+
+@register_tool("retry_policy")
+class RetryPolicy:
+    """
+    LLM 调用失败后的重试与拥塞判断
+
+    Attributes:
+        retry_base_delay: 退避基数（秒）
+        retry_max_delay: 单次等待上限（秒）
+    """
+
+    def __init__(self, llm_config: Dict[str, Any]) -> None:
+        """
+        初始化重试策略
+
+        Args:
+            llm_config: ConfigManager.get_llm_config() 返回的扁平化配置
+        """
+        self.retry_base_delay = llm_config.get('retry_base_delay', 1.0)
+        self.retry_max_delay = llm_config.get('retry_max_delay', 30.0)
+
+    @staticmethod
+    def is_congestion(error: Exception) -> bool:
+        """
+        判断调用失败是否由上游拥塞引起（并发限制器据此收缩）
+
+        429、5xx 以及不带状态码的超时/连接错误视为拥塞；
+        其余 4xx（鉴权、参数错误等）与并发无关。
+
+        Args:
+            error: 本次调用抛出的异常
+
+        Returns:
+            True 表示限流或上游故障
+        """
+        status_code = getattr(error, "status_code", None)
+        if status_code is None:
+            return True
+        return status_code == _THROTTLE_STATUS or status_code >= 500
+
+    def delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """
+        计算下一次重试前的等待秒数
+
+        规则：
+        1. 不可恢复错误（400/401/403/404）返回 None，调用方应立即放弃重试
+        2. 服务端返回 Retry-After 头时优先遵循（秒数或 HTTP 日期），但不超过 retry_max_delay
+        3. 否则使用 full jitter 指数退避：uniform(0, min(上限, base * 2^attempt))
+
+        Args:
+            attempt: 当前尝试序号（0-based）
+            error: 本次调用抛出的异常
+
+        Returns:
+            等待秒数，None 表示不应重试
+        """
+        status_code = getattr(error, "status_code", None)
+        if status_code in _UNRECOVERABLE_STATUS:
+            return None
+
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        retry_after = headers.get("retry-after") if headers is not None else None
+        if retry_after:
+            try:
+                delay: Optional[float] = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = retry_at.timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None and not math.isnan(delay):
+                # 截断到 retry_max_delay：过大（甚至 inf）的 Retry-After 会长时间占用并发名额
+                return min(self.retry_max_delay, max(0.0, delay))
+
+        ceiling = min(self.retry_max_delay, self.retry_base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
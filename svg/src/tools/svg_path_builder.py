@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SVG 输出路径工具
+
+按章节标题生成 "序号_标题文字.svg" 文件名，如 "1.1.1.1_模块划分原则.svg"。
+"""
+
+import os
+import re
+from typing import Optional, Tuple
+
+from ..agents.state import Section
+from ..utils import register_tool
+
+# 标题序号前缀（如 "1.1.1.1 "），group(1) 为序号
+_SERIAL_PREFIX_RE = re.compile(r'^(\d+(?:\.\d+)*)\s*')
+# 文件名中需替换为下划线的字符
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\u4e00-\u9fff]')
+
+
+@register_tool("svg_path_builder")
+class SVGPathBuilder:
+    """
+    章节 SVG 输出路径生成器
+
+    无状态，SmartDrawer 持有一个实例复用。
+    """
+
+    @staticmethod
+    def split_serial_number(title: str) -> Tuple[Optional[str], str]:
+        """
+        拆分标题中的序号前缀与标题文字
+
+        常见形态 "1.1.1.1 模块划分原则" 走 str.partition 快速路径，
+        其余形态（如序号后无空格）回退到正则。
+
+        Args:
+            title: 章节标题
+
+        Returns:
+            (序号, 标题文字) 元组；无序号时序号为 None，标题文字为原标题
+        """
+        head, sep, tail = title.partition(' ')
+        if (sep and head[:1].isdecimal() and head[-1:].isdecimal()
+                and '..' not in head and head.replace('.', '').isdecimal()):
+            return head, tail.lstrip()
+
+        match = _SERIAL_PREFIX_RE.match(title)
+        if match:
+            return match.group(1), title[match.end():]
+        return None, title
+
+    def build(self, section: Section, output_dir: str) -> str:
+        """
+        生成章节 SVG 输出路径（确保输出目录存在）
+
+        标题没有序号时使用三位索引。
+
+        Args:
+            section: 章节对象
+            output_dir: SVG 输出目录
+
+        Returns:
+            SVG 文件路径
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        # 从标题中提取序号部分（如 "1.1.1.1"）
+        serial_number, title_text = self.split_serial_number(section.title)
+        if serial_number is None:
+            # 标题没有序号，使用索引
+            serial_number = f"{section.index:03d}"
+
+        # 清理标题文字（将特殊字符替换为下划线）
+        safe_title = _UNSAFE_FILENAME_RE.sub('_', title_text).strip('_')[:30]
+        return os.path.join(output_dir, f"{serial_number}_{safe_title}.svg")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SVG 后处理工具
+
+Rule 4: 响应格式错误时尽量修复，无法修复再交由调用方生成备用内容。
+从 LLM 响应中提取 SVG，验证结构（见 svg_validator.py），仅缺 xmlns/viewBox 时就地修复。
+"""
+
+import re
+from typing import Optional, Tuple
+
+from ..utils import register_tool
+from .svg_validator import SVGValidator
+
+# 预编译正则（模块级，避免每次调用重复查找 re 内部缓存）
+# SVG 块定位优先用 str.find，该正则仅用于大写标签等非常规写法的回退
+_SVG_BLOCK_RE = re.compile(r'<svg[^>]*>.*?</svg>', re.DOTALL | re.IGNORECASE)
+_WIDTH_RE = re.compile(r'width=["\'](\d+)["\']')
+_HEIGHT_RE = re.compile(r'height=["\'](\d+)["\']')
+
+
+@register_tool("svg_postprocessor")
+class SVGPostProcessor:
+    """
+    SVG 提取、验证与修复
+
+    无状态，SmartDrawer 持有一个实例复用；结构验证委托 SVGValidator。
+    """
+
+    def __init__(self) -> None:
+        """初始化后处理器"""
+        self.validator = SVGValidator()
+
+    def extract(self, content: str) -> Optional[str]:
+        """
+        从 LLM 响应中提取 SVG 代码
+
+        Args:
+            content: LLM 原始响应
+
+        Returns:
+            提取的 SVG 代码，如果没有找到则返回 None
+        """
+        # 查找 <svg> ... </svg>：小写标签直接 str.find，否则回退到忽略大小写的正则
+        start = content.find('<svg')
+        end = content.find('</svg>', start) if start >= 0 else -1
+        if end >= 0:
+            svg_content = content[start:end + len('</svg>')]
+        else:
+            svg_match = _SVG_BLOCK_RE.search(content)
+            if svg_match is None:
+                return None
+            svg_content = svg_match.group(0)
+
+        # 检查是否有 XML 声明
+        if not svg_content.startswith('<?xml'):
+            svg_content = '<?xml version="1.0" encoding="UTF-8"?>\n' + svg_content
+
+        return svg_content
+
+    def fix(self, svg_content: str) -> str:
+        """
+        自动修复 SVG 代码中的常见问题（单次拼接完成全部修复）
+
+        修复项：
+        1. 添加缺失的 xmlns
+        2. 添加缺失的 viewBox
+        3. 确保 XML 声明
+
+        修复后根标签必然带有 xmlns 与 viewBox，调用方无需再次验证。
+
+        Args:
+            svg_content: 原始 SVG 代码
+
+        Returns:
+            修复后的 SVG 代码
+        """
+        xml_decl = '' if svg_content.startswith('<?xml') else '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+        # 与 SVGValidator.validate 一致，只看根 <svg> 开始标签
+        root_span = self.validator.root_tag_span(svg_content)
+        if root_span is None:
+            return xml_decl + svg_content
+        root_tag = svg_content[root_span[0]:root_span[1]]
+
+        # 汇总缺失属性，插入到根标签名之后
+        missing_attrs = ''
+        if SVGValidator.XMLNS not in root_tag:
+            missing_attrs += f' {SVGValidator.XMLNS}'
+        if 'viewBox' not in root_tag:
+            # 尝试从根标签提取 width 和 height，否则使用默认 viewBox
+            width_match = _WIDTH_RE.search(root_tag)
+            height_match = _HEIGHT_RE.search(root_tag)
+            if width_match and height_match:
+                missing_attrs += f' viewBox="0 0 {width_match.group(1)} {height_match.group(1)}"'
+            else:
+                missing_attrs += ' viewBox="0 0 800 600"'
+
+        if not missing_attrs:
+            return xml_decl + svg_content
+
+        insert_at = root_span[0] + len('<svg')
+        return xml_decl + svg_content[:insert_at] + missing_attrs + svg_content[insert_at:]
+
+    def process(self, llm_response: str) -> Tuple[Optional[str], str]:
+        """
+        从 LLM 响应中提取、验证并在必要时修复 SVG
+
+        Args:
+            llm_response: LLM 原始响应
+
+        Returns:
+            (SVG 代码, 错误信息) 元组；无法得到有效 SVG 时 SVG 代码为 None
+        """
+        svg_content = self.extract(llm_response)
+        if svg_content is None:
+            return None, "无法从LLM响应中提取SVG代码"
+
+        is_valid, error_msg = self.validator.validate(svg_content)
+        if not is_valid:
+            # 结构性错误无法修复；仅缺 xmlns/viewBox 时修复（修复结果无需再次验证）
+            if error_msg not in SVGValidator.FIXABLE_ERRORS:
+                return None, f"SVG验证失败: {error_msg}"
+            svg_content = self.fix(svg_content)
+
+        return svg_content, ""
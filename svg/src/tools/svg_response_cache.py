@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SVG 响应缓存工具
+
+相同模型参数与提示词（标题、正文、层级路径均一致）直接复用已生成的 SVG，省去一次 LLM 调用。
+"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from ..utils import LRUCache, register_tool
+
+# 进程内 SVG 结果缓存（键为模型参数 + 渲染后提示词的 blake2b 摘要，LRU 淘汰）
+# 放在模块级：每次运行 draw_svg 都会新建 SmartDrawer，同一进程内多次运行可复用
+_SVG_CACHE = LRUCache()
+
+
+@register_tool("svg_response_cache")
+class SVGResponseCache:
+    """
+    按模型参数与提示词缓存 SVG
+
+    Attributes:
+        llm_config: 当前 LLM 配置（model / temperature / base_url 参与缓存键）
+    """
+
+    def __init__(self, llm_config: Dict[str, Any]) -> None:
+        """
+        初始化缓存视图（共享缓存容量随热重载更新）
+
+        Args:
+            llm_config: ConfigManager.get_llm_config() 返回的扁平化配置
+        """
+        self.llm_config = llm_config
+        _SVG_CACHE.maxsize = llm_config.get('response_cache_size', 128)
+
+    def key(self, system_prompt: str, user_prompt: str) -> bytes:
+        """
+        计算提示词缓存键
+
+        键中包含 model / temperature / base_url：热重载切换后端或模型后，
+        不会复用旧模型生成的 SVG。
+
+        Args:
+            system_prompt: 系统提示词
+            user_prompt: 用户提示词
+
+        Returns:
+            16 字节 blake2b 摘要
+        """
+        llm_config = self.llm_config
+        key = "\0".join((
+            str(llm_config.get('model')),
+            str(llm_config.get('temperature')),
+            str(llm_config.get('base_url')),
+            system_prompt,
+            user_prompt,
+        ))
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+    @staticmethod
+    def get(key: bytes) -> Optional[str]:
+        """读取缓存的 SVG（命中时刷新 LRU 顺序）"""
+        return _SVG_CACHE.get(key)
+
+    @staticmethod
+    def put(key: bytes, svg_content: str) -> None:
+        """写入缓存，超出容量时淘汰最久未使用的条目"""
+        _SVG_CACHE.put(key, svg_content)
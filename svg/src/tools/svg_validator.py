@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SVG 验证工具
+
+检查 LLM 生成的 SVG 结构是否完整；属性只在根 <svg> 开始标签内查找。
+"""
+
+import re
+from typing import Optional, Tuple
+
+from ..utils import register_tool
+
+# SVG 标签定位优先用 str.find / str.count，以下两个仅用于大写标签等非常规写法的回退
+_SVG_OPEN_TAG_RE = re.compile(r'<svg[^>]*>', re.IGNORECASE)
+_SVG_CLOSE_TAG_RE = re.compile(r'</svg>', re.IGNORECASE)
+
+
+@register_tool("svg_validator")
+class SVGValidator:
+    """
+    SVG 结构验证
+
+    无状态，SVGPostProcessor 持有一个实例复用。
+
+    Attributes:
+        XMLNS: SVG 根标签必需的命名空间属性
+        FIXABLE_ERRORS: 可由 SVGPostProcessor.fix 修复的验证错误（缺 xmlns / viewBox）
+    """
+
+    XMLNS = 'xmlns="http://www.w3.org/2000/svg"'
+    ERR_NO_XMLNS = "缺少xmlns命名空间"
+    ERR_NO_VIEWBOX = "缺少viewBox属性"
+    FIXABLE_ERRORS = frozenset({ERR_NO_XMLNS, ERR_NO_VIEWBOX})
+
+    @staticmethod
+    def root_tag_span(svg_content: str) -> Optional[Tuple[int, int]]:
+        """
+        定位根 <svg ...> 开始标签
+
+        Args:
+            svg_content: SVG 代码
+
+        Returns:
+            (起始下标, 结束下标) 元组，svg_content[start:end] 即开始标签；不存在时返回 None
+        """
+        start = svg_content.find('<svg')
+        if start >= 0:
+            end = svg_content.find('>', start)
+            return (start, end + 1) if end >= 0 else None
+        root_match = _SVG_OPEN_TAG_RE.search(svg_content)
+        return root_match.span() if root_match else None
+
+    def validate(self, svg_content: str) -> Tuple[bool, str]:
+        """
+        验证 SVG 代码的完整性和正确性
+
+        验证项（可由 fix 修复的两项放在最后检查）：
+        1. 包含 <svg> 标签
+        2. 标签正确闭合
+        3. 根 <svg> 标签包含 xmlns 命名空间
+        4. 根 <svg> 标签包含 viewBox 属性
+
+        Args:
+            svg_content: SVG 代码
+
+        Returns:
+            (是否有效, 错误信息) 元组
+        """
+        # 检查 <svg> 标签；属性只在根开始标签内查找，不扫描整个正文
+        root_span = self.root_tag_span(svg_content)
+        if root_span is None:
+            return False, "缺少<svg>标签"
+        root_tag = svg_content[root_span[0]:root_span[1]]
+
+        # 检查标签闭合（小写标签用 str.count，C 层单次扫描）
+        if '<svg' in svg_content:
+            svg_open_count = svg_content.count('<svg')
+            svg_close_count = svg_content.count('</svg>')
+        else:
+            svg_open_count = len(_SVG_OPEN_TAG_RE.findall(svg_content))
+            svg_close_count = len(_SVG_CLOSE_TAG_RE.findall(svg_content))
+        if svg_open_count != svg_close_count:
+            return False, "<svg>标签未正确闭合"
+
+        # 检查 xmlns
+        if self.XMLNS not in root_tag:
+            return False, self.ERR_NO_XMLNS
+
+        # 检查 viewBox
+        if 'viewBox' not in root_tag:
+            return False, self.ERR_NO_VIEWBOX
+
+        return True, ""
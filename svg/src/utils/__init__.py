@@ -14,6 +14,12 @@ from .registry import (
     list_tools,
     list_nodes,
 )
+from .circuit_breaker import CircuitBreaker
+from .aimd_limiter import AIMDLimiter
+from .rate_limiter import SlidingWindowRateLimiter
+from .atomic_write import atomic_write
+from .lru_cache import LRUCache
+from .append_jsonl import append_jsonl
 
 __all__ = [
     "register_tool",
@@ -22,4 +28,10 @@ __all__ = [
     "get_node",
     "list_tools",
     "list_nodes",
+    "CircuitBreaker",
+    "AIMDLimiter",
+    "SlidingWindowRateLimiter",
+    "atomic_write",
+    "LRUCache",
+    "append_jsonl",
 ]
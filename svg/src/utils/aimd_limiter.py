@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AIMD 自适应并发限制模块
+
+替代固定大小的 asyncio.Semaphore：
+- 调用成功且滑动窗口平均延迟不超过目标时，并发上限加法增长（+increase）
+- 调用失败（限流、超时等）时，并发上限乘法下降（*decrease）
+上限始终夹在 [min_limit, max_limit] 之间。
+"""
+
+import asyncio
+from collections import deque
+from typing import Optional
+
+
+class AIMDLimiter:
+    """
+    asyncio 自适应并发限制器（需在事件循环内创建和使用）
+
+    Attributes:
+        limit: 当前并发上限（浮点，取整后生效）
+        min_limit: 并发下限
+        max_limit: 并发上限
+        latency_target: 目标平均延迟（秒），<=0 表示不看延迟
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        latency_target: float = 0.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        window: int = 32,
+    ) -> None:
+        """
+        初始化限制器（初始并发上限为 max_limit）
+
+        Args:
+            max_limit: 并发上限
+            min_limit: 并发下限
+            latency_target: 目标平均延迟（秒），<=0 表示成功即增长
+            increase: 每次成功的加法增量
+            decrease: 每次失败的乘法系数
+            window: 延迟滑动窗口大小
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(self.max_limit)
+        self.latency_target = latency_target
+        self._increase = increase
+        self._decrease = decrease
+        self._latencies: deque = deque(maxlen=window)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """等待直到在途数低于当前并发上限，然后占用一个名额"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    async def release(self, success: Optional[bool], latency: Optional[float] = None) -> None:
+        """
+        归还名额并按本次结果调整并发上限
+
+        Args:
+            success: 本次调用是否成功；None 表示结果与拥塞无关，只归还名额不调整上限
+            latency: 本次调用耗时（秒），None 表示不计入窗口
+        """
+        async with self._cond:
+            self._in_flight -= 1
+            if latency is not None:
+                self._latencies.append(latency)
+
+            if success is False:
+                self.limit = max(float(self.min_limit), self.limit * self._decrease)
+            elif success and (self.latency_target <= 0 or (
+                self._latencies
+                and sum(self._latencies) / len(self._latencies) <= self.latency_target
+            )):
+                self.limit = min(float(self.max_limit), self.limit + self._increase)
+
+            self._cond.notify_all()
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON Lines 追加写模块
+
+每条记录序列化为一行，以追加模式单次 write 写入并 flush：
+进程中途崩溃时最多丢失最后一行，已写入的行保持完整可读。
+"""
+
+import json
+from typing import Any, Dict
+
+
+def append_jsonl(path: str, record: Dict[str, Any]) -> None:
+    """
+    追加一条 JSON 记录到文件末尾
+
+    Args:
+        path: 目标文件路径（不存在时创建）
+        record: 可 JSON 序列化的字典
+    """
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(line)
+        f.flush()
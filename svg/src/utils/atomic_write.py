@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+原子写文件模块
+
+先写入同目录临时文件并 fsync，再用 os.replace 原子替换目标文件：
+进程中途崩溃时目标文件要么是旧内容、要么是完整新内容，不会出现写了一半的文件。
+"""
+
+import os
+import threading
+from typing import Union
+
+
+def atomic_write(path: str, data: Union[str, bytes], buffering: int = 1 << 16) -> None:
+    """
+    原子写入文件
+
+    Args:
+        path: 目标文件路径
+        data: 文件内容（str 按 UTF-8 写入，bytes 原样写入）
+        buffering: 写缓冲区大小（字节）
+    """
+    # 临时文件名带进程与线程 ID，并发写同一目标时互不覆盖
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if isinstance(data, bytes):
+        f = open(tmp_path, 'wb', buffering=buffering)
+    else:
+        f = open(tmp_path, 'w', encoding='utf-8', buffering=buffering)
+
+    try:
+        with f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # 写入失败时清理临时文件，目标文件保持原样
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
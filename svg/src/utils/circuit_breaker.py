@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+熔断器模块
+
+Rule 4: 失败优雅降级原则
+上游持续失败时快速失败，避免每个章节都走完整的重试退避流程。
+
+状态机：
+- CLOSED：正常放行，连续失败达到阈值后转为 OPEN
+- OPEN：拒绝所有调用，超过 reset_timeout 后转为 HALF_OPEN
+- HALF_OPEN：仅放行一次探测调用，成功则 CLOSED，失败则重新 OPEN
+"""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    线程安全的熔断器
+
+    Attributes:
+        fail_threshold: 连续失败多少次后打开熔断
+        reset_timeout: 熔断打开后多少秒允许探测
+        state: 当前状态（closed / open / half_open）
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, fail_threshold: int = 5, reset_timeout: float = 60.0) -> None:
+        """
+        初始化熔断器
+
+        Args:
+            fail_threshold: 连续失败阈值（<=0 表示永不熔断）
+            reset_timeout: 熔断持续秒数
+        """
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        判断当前是否允许发起调用
+
+        Returns:
+            True 表示放行，False 表示熔断中应快速失败
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # HALF_OPEN：同一时间只放行一个探测调用
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """记录一次成功调用，关闭熔断并清零失败计数"""
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """记录一次失败调用，达到阈值或探测失败时打开熔断"""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or (
+                self.fail_threshold > 0 and self._failures >= self.fail_threshold
+            ):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -5,39 +5,124 @@
 
 Rule 6: 状态可观测原则
 每步状态变更打印结构化日志（含 thread_id 与 node_name）
+
+日志先写入内存缓冲，在节点结束、关键决策、出现错误或缓冲超过 _FLUSH_LINES 行时批量写出；
+后台守护线程每 _FLUSH_INTERVAL 秒输出一次，长时间无新日志时也不会滞留；
+未捕获异常打印 traceback 之前、进程退出时均先 flush，保证日志与异常按发生顺序输出。
 """
 
-from typing import Optional
-from datetime import datetime
+import atexit
+import sys
+import threading
+import time
+from typing import List, Optional, Tuple
+
+# 秒级时间戳前缀缓存 (秒, "YYYY-MM-DDTHH:MM:SS")，整体替换保证多线程下前缀与秒一致
+_second_cache: Tuple[int, str] = (-1, "")
+
+
+def _timestamp() -> str:
+    """
+    生成 ISO 格式时间戳（含微秒）
+
+    同一秒内复用已格式化的前缀，避免每条日志构造 datetime 对象并格式化。
+    """
+    global _second_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _second_cache
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _second_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}"
+
+
+# 待输出日志缓冲（多线程并发绘制时共用，写入与输出均加锁）
+_buffer: List[str] = []
+_buffer_lock = threading.Lock()
+_FLUSH_LINES = 64
+_FLUSH_INTERVAL = 0.5
+_flusher: Optional[threading.Thread] = None
+
+
+def flush_logs() -> None:
+    """将缓冲中的日志一次性写出到标准输出"""
+    with _buffer_lock:
+        if _buffer:
+            stream = sys.stdout
+            stream.write("".join(_buffer))
+            stream.flush()
+            _buffer.clear()
+
+
+def _flush_periodically() -> None:
+    """后台守护线程：定时输出缓冲（LLM 调用期间没有新日志时，已写入的进度也能及时可见）"""
+    while True:
+        time.sleep(_FLUSH_INTERVAL)
+        flush_logs()
+
+
+def _emit(line: str, flush: bool = False) -> None:
+    """
+    写入一行日志到缓冲，必要时批量输出
+
+    Args:
+        line: 日志内容（不含换行）
+        flush: 是否立即输出（节点结束、错误等边界）
+    """
+    global _flusher
+    with _buffer_lock:
+        _buffer.append(line + "\n")
+        should_flush = flush or len(_buffer) >= _FLUSH_LINES
+        # 首次写日志时启动后台刷新线程
+        if _flusher is None:
+            _flusher = threading.Thread(
+                target=_flush_periodically, name="log-flusher", daemon=True
+            )
+            _flusher.start()
+    if should_flush:
+        flush_logs()
+
+
+def _flush_before_excepthook(exc_type, exc_value, exc_traceback) -> None:
+    """未捕获异常：先输出缓冲中的日志，再交给原 excepthook 打印 traceback"""
+    flush_logs()
+    _previous_excepthook(exc_type, exc_value, exc_traceback)
+
+
+atexit.register(flush_logs)
+_previous_excepthook = sys.excepthook
+sys.excepthook = _flush_before_excepthook
 
 
 def log_node_start(node_name: str, thread_id: str) -> None:
     """记录节点开始执行"""
-    timestamp = datetime.now().isoformat()
-    print(f"[{timestamp}] [thread:{thread_id}] [node:{node_name}] ▶️ 开始执行")
+    timestamp = _timestamp()
+    _emit(f"[{timestamp}] [thread:{thread_id}] [node:{node_name}] ▶️ 开始执行")
 
 
 def log_node_end(node_name: str, thread_id: str, success: bool = True) -> None:
     """记录节点执行完成"""
-    timestamp = datetime.now().isoformat()
+    timestamp = _timestamp()
     status = "✅ 成功" if success else "❌ 失败"
-    print(f"[{timestamp}] [thread:{thread_id}] [node:{node_name}] {status} 执行完成")
+    _emit(f"[{timestamp}] [thread:{thread_id}] [node:{node_name}] {status} 执行完成", flush=True)
 
 
 def log_node_error(node_name: str, thread_id: str, error: str) -> None:
     """记录节点执行错误"""
-    timestamp = datetime.now().isoformat()
-    print(f"[{timestamp}] [thread:{thread_id}] [node:{node_name}] ❌ 错误: {error}")
+    timestamp = _timestamp()
+    _emit(f"[{timestamp}] [thread:{thread_id}] [node:{node_name}] ❌ 错误: {error}", flush=True)
 
 
 def log_info(node_name: str, thread_id: str, message: str) -> None:
     """记录一般信息"""
-    timestamp = datetime.now().isoformat()
-    print(f"[{timestamp}] [thread:{thread_id}] [node:{node_name}] ℹ️ {message}")
+    timestamp = _timestamp()
+    _emit(f"[{timestamp}] [thread:{thread_id}] [node:{node_name}] ℹ️ {message}")
 
 
 def log_decision(node_name: str, thread_id: str, decision: str, details: Optional[str] = None) -> None:
     """记录关键决策节点（工具调用、LLM 输出）"""
-    timestamp = datetime.now().isoformat()
+    timestamp = _timestamp()
     detail_str = f" ({details})" if details else ""
-    print(f"[{timestamp}] [thread:{thread_id}] [node:{node_name}] 🔀 决策: {decision}{detail_str}")
+    _emit(f"[{timestamp}] [thread:{thread_id}] [node:{node_name}] 🔀 决策: {decision}{detail_str}",
+          flush=True)
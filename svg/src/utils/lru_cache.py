@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+线程安全 LRU 缓存模块
+
+基于 OrderedDict：命中时移到末尾，超出容量时从头部淘汰最久未使用的条目。
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    线程安全的 LRU 缓存
+
+    Attributes:
+        maxsize: 最大条目数（<=0 表示不缓存）
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        初始化缓存
+
+        Args:
+            maxsize: 最大条目数（<=0 表示不缓存）
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """读取缓存（命中时刷新 LRU 顺序），未命中返回 None"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """写入缓存，超出容量时淘汰最久未使用的条目"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+滑动窗口限速模块
+
+在请求发出前按"每 window 秒最多 limit 次"预先排队，
+避免突发请求超过服务端 RPM 后白白耗费一次往返换回 429。
+
+采用预约方式：reserve() 立即登记一个发送时间点并返回需要等待的秒数，
+调用方自行等待（协程中用 asyncio.sleep，不阻塞事件循环）。
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class SlidingWindowRateLimiter:
+    """
+    线程安全的滑动窗口限速器
+
+    Attributes:
+        limit: 窗口内最多请求数（<=0 表示不限速）
+        window: 窗口长度（秒）
+    """
+
+    def __init__(self, limit: int, window: float = 60.0) -> None:
+        """
+        初始化限速器
+
+        Args:
+            limit: 窗口内最多请求数（<=0 表示不限速）
+            window: 窗口长度（秒）
+        """
+        self.limit = limit
+        self.window = window
+        self._slots: deque = deque()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        预约一次请求的发送时间
+
+        Returns:
+            距离可发送时间的等待秒数（0 表示立即发送）
+        """
+        if self.limit <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            # 清除已滑出窗口的发送记录
+            while self._slots and self._slots[0] <= now - self.window:
+                self._slots.popleft()
+
+            if len(self._slots) < self.limit:
+                slot = now
+            else:
+                # 窗口已满：排在第 limit 个之前那次请求滑出窗口之后
+                slot = max(now, self._slots[-self.limit] + self.window)
+            self._slots.append(slot)
+            return slot - now
@@ -31,11 +31,9 @@ def export_mermaid(workflow, output_path: str = "output/workflow_graph.md") -> s
     import os
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
+    # 先拼接完整内容，再一次写入
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("# SVG 工作流图\n\n")
-        f.write("```mermaid\n")
-        f.write(mermaid_code)
-        f.write("\n```\n")
+        f.write(f"# SVG 工作流图\n\n```mermaid\n{mermaid_code}\n```\n")
 
     return mermaid_code
 
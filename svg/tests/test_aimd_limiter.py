@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""AIMDLimiter 测试：失败乘法收缩、仅在延迟达标时加法增长、上限夹在 [min, max]"""
+
+import asyncio
+
+from src.utils import AIMDLimiter
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_failure_shrinks_limit_multiplicatively():
+    async def scenario():
+        limiter = AIMDLimiter(max_limit=8, decrease=0.5)
+        await limiter.acquire()
+        await limiter.release(success=False)
+        return limiter.limit
+
+    assert _run(scenario()) == 4.0
+
+
+def test_failures_never_go_below_min_limit():
+    async def scenario():
+        limiter = AIMDLimiter(max_limit=8, min_limit=2, decrease=0.5)
+        for _ in range(10):
+            await limiter.acquire()
+            await limiter.release(success=False)
+        return limiter.limit
+
+    assert _run(scenario()) == 2.0
+
+
+def test_success_grows_only_under_latency_target():
+    async def scenario():
+        limiter = AIMDLimiter(max_limit=8, latency_target=1.0, increase=1.0, window=1)
+        limiter.limit = 2.0
+
+        # 平均延迟超过目标：不增长
+        await limiter.acquire()
+        await limiter.release(success=True, latency=2.0)
+        slow = limiter.limit
+
+        # 平均延迟回到目标以内：加法增长
+        await limiter.acquire()
+        await limiter.release(success=True, latency=0.5)
+        return slow, limiter.limit
+
+    assert _run(scenario()) == (2.0, 3.0)
+
+
+def test_successes_never_exceed_max_limit():
+    async def scenario():
+        limiter = AIMDLimiter(max_limit=3, increase=1.0)
+        for _ in range(10):
+            await limiter.acquire()
+            await limiter.release(success=True, latency=0.1)
+        return limiter.limit
+
+    assert _run(scenario()) == 3.0
+
+
+def test_neutral_release_only_returns_slot():
+    async def scenario():
+        limiter = AIMDLimiter(max_limit=4, increase=1.0)
+        limiter.limit = 2.0
+        await limiter.acquire()
+        await limiter.release(success=None)
+        return limiter.limit, limiter._in_flight
+
+    assert _run(scenario()) == (2.0, 0)
+
+
+def test_acquire_waits_when_limit_reached():
+    async def scenario():
+        limiter = AIMDLimiter(max_limit=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        blocked = not waiter.done()
+        await limiter.release(success=None)
+        await asyncio.wait_for(waiter, timeout=1.0)
+        return blocked
+
+    assert _run(scenario()) is True
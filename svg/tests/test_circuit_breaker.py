@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""CircuitBreaker 测试：CLOSED -> OPEN -> HALF_OPEN，半开时只放行一次探测"""
+
+import importlib
+
+import pytest
+
+from src.utils import CircuitBreaker
+
+
+class _FakeClock:
+    """可手动推进的 monotonic 时钟"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    module = importlib.import_module("src.utils.circuit_breaker")
+    monkeypatch.setattr(module, "time", fake)
+    return fake
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(fail_threshold=3, reset_timeout=10.0)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(fail_threshold=2, reset_timeout=10.0)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_allows_exactly_one_probe(clock):
+    breaker = CircuitBreaker(fail_threshold=1, reset_timeout=10.0)
+    breaker.record_failure()
+
+    clock.now += 9.9
+    assert not breaker.allow()
+
+    clock.now += 0.2
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+    assert not breaker.allow()
+
+
+def test_probe_success_closes(clock):
+    breaker = CircuitBreaker(fail_threshold=1, reset_timeout=10.0)
+    breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+def test_probe_failure_reopens(clock):
+    breaker = CircuitBreaker(fail_threshold=5, reset_timeout=10.0)
+    for _ in range(5):
+        breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_non_positive_threshold_never_opens(clock):
+    breaker = CircuitBreaker(fail_threshold=0)
+    for _ in range(100):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""SlidingWindowRateLimiter 测试：预约时间点的滑动窗口计算"""
+
+import importlib
+
+import pytest
+
+from src.utils import SlidingWindowRateLimiter
+
+
+class _FakeClock:
+    """可手动推进的 monotonic 时钟"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    module = importlib.import_module("src.utils.rate_limiter")
+    monkeypatch.setattr(module, "time", fake)
+    return fake
+
+
+def test_unlimited_never_waits(clock):
+    limiter = SlidingWindowRateLimiter(0, window=60.0)
+    assert [limiter.reserve() for _ in range(100)] == [0.0] * 100
+
+
+def test_requests_within_limit_go_immediately(clock):
+    limiter = SlidingWindowRateLimiter(3, window=60.0)
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_full_window_queues_behind_oldest_slot(clock):
+    limiter = SlidingWindowRateLimiter(2, window=60.0)
+    limiter.reserve()
+    clock.now += 10.0
+    limiter.reserve()
+    clock.now += 5.0
+
+    # 第 3、4 个请求分别排在第 1、2 个滑出窗口之后
+    assert limiter.reserve() == pytest.approx(45.0)
+    assert limiter.reserve() == pytest.approx(55.0)
+    # 第 5 个排在第 3 个（预约在 t=1060）之后
+    assert limiter.reserve() == pytest.approx(105.0)
+
+
+def test_slots_slide_out_of_window(clock):
+    limiter = SlidingWindowRateLimiter(2, window=60.0)
+    limiter.reserve()
+    limiter.reserve()
+
+    clock.now += 60.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(60.0)
+
+
+def test_lowered_limit_applies_to_existing_slots(clock):
+    limiter = SlidingWindowRateLimiter(3, window=60.0)
+    for _ in range(3):
+        limiter.reserve()
+
+    limiter.limit = 1
+    assert limiter.reserve() == pytest.approx(60.0)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""断点续跑测试：resume_key 或 content_hash 不一致时必须重新绘制"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("langchain_openai")
+
+from src.agents.nodes.draw_svg import _draw_one  # noqa: E402
+from src.agents.state import Section, SVGResult  # noqa: E402
+
+
+class _RecordingDrawer:
+    """记录 adraw 调用的绘图器，直接写出固定 SVG"""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def adraw(self, section, output_dir, limiter=None):
+        self.calls.append(section.index)
+        svg_path = f"{output_dir}/{section.index:03d}_new.svg"
+        with open(svg_path, "w", encoding="utf-8") as f:
+            f.write("<svg>new</svg>")
+        return SVGResult(
+            section_index=section.index,
+            section_title=section.title,
+            svg_content="<svg>new</svg>",
+            svg_path=svg_path,
+            success=True,
+        )
+
+
+def _section(index=0, title="1.1 标题", content="正文"):
+    return Section(index=index, title=title, content=content, hierarchy_path="第一章")
+
+
+def _completed(tmp_path, section, content_hash=None):
+    """构造上次运行的已完成映射（SVG 文件真实存在）"""
+    svg_path = tmp_path / "old.svg"
+    svg_path.write_text("<svg>old</svg>", encoding="utf-8")
+    return {
+        Section.resume_key(section.index, section.title): {
+            "svg_path": str(svg_path),
+            "content_hash": content_hash or section.content_hash(),
+        }
+    }
+
+
+def _draw(drawer, section, completed, tmp_path):
+    return asyncio.run(_draw_one(
+        drawer, section, str(tmp_path), completed, "test", "1/1", None,
+        str(tmp_path / ".progress.jsonl"),
+    ))
+
+
+def test_unchanged_section_is_reused(tmp_path):
+    section = _section()
+    drawer = _RecordingDrawer()
+
+    result = _draw(drawer, section, _completed(tmp_path, section), tmp_path)
+
+    assert drawer.calls == []
+    assert result.svg_content == "<svg>old</svg>"
+
+
+def test_content_hash_mismatch_forces_redraw(tmp_path):
+    old = _section(content="旧正文")
+    completed = _completed(tmp_path, old)
+    drawer = _RecordingDrawer()
+
+    result = _draw(drawer, _section(content="新正文"), completed, tmp_path)
+
+    assert drawer.calls == [0]
+    assert result.svg_content == "<svg>new</svg>"
+
+
+def test_resume_key_mismatch_forces_redraw(tmp_path):
+    # 章节插入后序号后移：同名标题但序号不同，不能复用
+    completed = _completed(tmp_path, _section(index=0))
+    drawer = _RecordingDrawer()
+
+    _draw(drawer, _section(index=1), completed, tmp_path)
+
+    assert drawer.calls == [1]
+
+
+def test_missing_svg_file_forces_redraw(tmp_path):
+    section = _section()
+    completed = _completed(tmp_path, section)
+    (tmp_path / "old.svg").unlink()
+    drawer = _RecordingDrawer()
+
+    _draw(drawer, section, completed, tmp_path)
+
+    assert drawer.calls == [0]
+
+
+def test_redraw_appends_progress_record(tmp_path):
+    drawer = _RecordingDrawer()
+
+    _draw(drawer, _section(), {}, tmp_path)
+
+    lines = (tmp_path / ".progress.jsonl").read_text(encoding="utf-8").splitlines()
+    record = json.loads(lines[0])
+    assert record["index"] == 0
+    assert record["content_hash"] == _section().content_hash()